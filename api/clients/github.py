@@ -1,8 +1,11 @@
 """GitHub REST client for applying triage decisions and fetching issues."""
 from __future__ import annotations
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import Any, Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Mapping
 
 import httpx
 
@@ -10,12 +13,82 @@ from api.utils.logging_utils import get_logger, logging_context
 
 logger = get_logger("api.clients.github")
 
+# Sized for the triage worker's fan-out: every connection may stay warm, and
+# HTTP/2 multiplexes concurrent calls onto the same TLS session.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=60.0)
+
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions every ``per`` seconds.
+
+    The refill bookkeeping never awaits, so it is atomic on the event loop and
+    no lock is held while a caller sleeps waiting for the next token.
+    """
+
+    def __init__(self, rate: float, per: float) -> None:
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._fill_rate = float(rate) / float(per)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self._tokens) / self._fill_rate)
+
+
+def _retry_delay(status_code: int, headers: Mapping[str, str]) -> float | None:
+    """Seconds to wait before retrying a rate-limited response, or ``None`` to give up.
+
+    ``Retry-After`` (secondary limits) may be delta-seconds or an HTTP-date. GitHub
+    sends ``x-ratelimit-reset`` on every response, so that epoch timestamp is only
+    used once the primary limit is exhausted (``x-ratelimit-remaining: 0``) or on a
+    429; any other 403 is a real permission error and is not retried.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    if status_code != 429 and headers.get("x-ratelimit-remaining") != "0":
+        return None
+    reset = headers.get("x-ratelimit-reset")
+    if reset is not None:
+        try:
+            return max(0.0, float(reset) - time.time())
+        except ValueError:
+            pass
+    return None
+
+
 class GitHubClient:
     """Minimal GitHub REST API wrapper following official docs."""
 
-    def __init__(self, token: str, base_url: str = "https://api.github.com") -> None:
+    def __init__(
+            self,
+            token: str,
+            base_url: str = "https://api.github.com",
+            *,
+            max_concurrency: int = 10,
+            rate: float = 80,
+            per: float = 60.0,
+            max_retries: int = 3,
+    ) -> None:
         self._token = token
         self._base_url = base_url.rstrip("/")
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._bucket = TokenBucket(rate=rate, per=per)
+        self._max_retries = max_retries
         self._client = httpx.AsyncClient(
             base_url = self._base_url,
             headers = {
@@ -23,41 +96,70 @@ class GitHubClient:
                 "Accept": "application/vnd.github+json",
             },
             timeout = httpx.Timeout(10.0, read = 30.0),
+            limits = _HTTP_LIMITS,
+            http2 = True,
         )
 
     async def close(self) -> None:
         await self._client.aclose()
 
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a throttled request, honouring ``Retry-After`` on rate-limit responses.
+
+        The token is taken before entering the semaphore so a caller waiting on the
+        bucket does not hold a concurrency slot, and both are released before
+        sleeping for a retry. 403/429 responses that are not rate limits, or carry
+        no usable delay, are returned as-is rather than retried.
+        """
+        send = getattr(self._client, method)
+        attempt = 0
+        while True:
+            await self._bucket.acquire()
+            async with self._sem:
+                resp = await send(url, **kwargs)
+            if resp.status_code not in (403, 429) or attempt >= self._max_retries:
+                return resp
+            delay = _retry_delay(resp.status_code, resp.headers)
+            if delay is None:
+                return resp
+            attempt += 1
+            with logging_context(url=url, attempt=attempt, retry_after=delay):
+                logger.warning("GitHub rate limited request; retrying")
+            await asyncio.sleep(delay)
 
     async def fetch_issue(self, repo: str, number: int) -> Mapping[str, Any]:
         url = f"/repos/{repo}/issues/{number}"
-        resp = await self._client.get(url)
+        resp = await self._request("get", url)
         resp.raise_for_status()
         return resp.json()
 
     async def add_labels(self, repo: str, number: int, labels: list[str]) -> None:
         url = f"/repos/{repo}/issues/{number}/labels"
-        resp = await self._client.post(url, json={"labels": labels})
+        resp = await self._request("post", url, json={"labels": labels})
         resp.raise_for_status()
         with logging_context(repo=repo, number=number, action="add_labels"):
             logger.info("Applied labels", extra={"context": {"labels": labels}})
 
     async def create_comment(self, repo: str, number: int, body: str) -> None:
         url = f"/repos/{repo}/issues/{number}/comments"
-        resp = await self._client.post(url, json={"body": body})
+        resp = await self._request("post", url, json={"body": body})
         resp.raise_for_status()
         with logging_context(repo=repo, number=number, action="create_comment"):
             logger.info("Created comment")
 
     async def assign_issue(self, repo: str, number: int, assignees: list[str]) -> None:
         url = f"/repos/{repo}/issues/{number}/assignees"
-        resp = await self._client.post(url, json={"assignees": assignees})
+        resp = await self._request("post", url, json={"assignees": assignees})
         resp.raise_for_status()
         with logging_context(repo=repo, number=number, action="assign_issue"):
             logger.info("Assigned issue", extra={"context": {"assignees": assignees}})
 
 @asynccontextmanager
-async def with_client(token: str) -> GitHubClient:
+async def with_client(token: str, existing: GitHubClient | None = None) -> AsyncIterator[GitHubClient]:
+    """Yield ``existing`` when provided (left open), otherwise a short-lived client."""
+    if existing is not None:
+        yield existing
+        return
     client = GitHubClient(token=token)
     try:
         yield client
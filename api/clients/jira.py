@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from typing import Any, Mapping
+from typing import Any, AsyncIterator, Mapping
 
 import httpx
 
@@ -10,6 +10,9 @@ from api.utils.logging_utils import get_logger, logging_context
 
 logger = get_logger("api.clients.jira")
 
+# Same pool sizing as the GitHub client (see api.clients.github).
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=60.0)
+
 class JiraClient:
     def __init__(self, base_url: str, email: str, api_token: str) -> None:
         self._base_url = base_url.rstrip("/")
@@ -20,6 +23,8 @@ class JiraClient:
             },
             auth=(email, api_token),
             timeout=httpx.Timeout(10.0, read=30.0),
+            limits=_HTTP_LIMITS,
+            http2=True,
         )
 
     async def close(self) -> None:
@@ -63,7 +68,16 @@ class JiraClient:
             logger.info("Assigned issue", extra={"context": {"account_id": account_id}})
 
 @asynccontextmanager
-async def with_client(base_url: str, email: str, api_token: str) -> JiraClient:
+async def with_client(
+        base_url: str,
+        email: str,
+        api_token: str,
+        existing: JiraClient | None = None,
+) -> AsyncIterator[JiraClient]:
+    """Yield ``existing`` when provided (left open), otherwise a short-lived client."""
+    if existing is not None:
+        yield existing
+        return
     client = JiraClient(base_url=base_url, email=email, api_token=api_token)
     try:
         yield client
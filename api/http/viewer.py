@@ -5,8 +5,11 @@ from __future__ import annotations
 from typing import Any
 
 import asyncpg
+import orjson
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
 
 from api.schemas import (
     IssueRoute,
@@ -15,9 +18,15 @@ from api.schemas import (
     IssueViewerRecord,
 )
 from api.services import retrieve
+from api.utils.logging_utils import get_logger
+
+logger = get_logger("api.http.viewer")
 
 router = APIRouter(prefix="/api", tags=["viewer"])
 
+# Validates a whole result page in one pydantic-core call rather than per row.
+_SEARCH_ITEMS = TypeAdapter(list[IssueSearchItem])
+
 
 async def get_db_pool(request: Request) -> asyncpg.Pool:
     pool = getattr(request.app.state, "db_pool", None)
@@ -27,19 +36,41 @@ async def get_db_pool(request: Request) -> asyncpg.Pool:
 
 
 @router.get("/routes", response_model=list[IssueRoute])
-async def get_routes(pool: asyncpg.Pool = Depends(get_db_pool)) -> list[IssueRoute]:
+async def get_routes(
+        request: Request,
+        pool: asyncpg.Pool = Depends(get_db_pool),
+) -> Response:
+    redis = getattr(request.app.state, "redis", None)
+    if redis is not None:
+        # The cache is best-effort: a Redis outage falls through to the database.
+        try:
+            cached = await redis.get(retrieve.ROUTES_CACHE_KEY)
+        except RedisError:
+            logger.exception("Routes cache read failed")
+            cached = None
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
     routes = await retrieve.list_canonical_routes(pool)
-    return [IssueRoute(route=route) for route in routes]
+    # Routes are plain strings built by the retrieve service, so serialize the
+    # IssueRoute shape directly instead of constructing a model per row.
+    payload = orjson.dumps([{"route": route} for route in routes])
+    if redis is not None:
+        try:
+            await redis.setex(retrieve.ROUTES_CACHE_KEY, retrieve.ROUTES_CACHE_TTL_SECONDS, payload)
+        except RedisError:
+            logger.exception("Routes cache write failed")
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/issues/by-route/{route:path}", response_model=IssueViewerRecord)
 async def get_issue_by_route(
         route: str,
         pool: asyncpg.Pool = Depends(get_db_pool),
-) -> IssueViewerRecord | JSONResponse:
+) -> IssueViewerRecord | ORJSONResponse:
     record = await retrieve.fetch_issue_by_route(pool, route)
     if record is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={
                 "error": "route not found",
@@ -60,7 +91,7 @@ async def search_issues(
         state: list[str] | None = Query(default=None),
         priority: list[str] | None = Query(default=None),
         limit: int = Query(default=50, ge=1, le=200),
-) -> IssueSearchResponse:
+) -> Response:
     filters: dict[str, Any] = {
         "q": q,
         "sources": source or None,
@@ -70,6 +101,10 @@ async def search_issues(
         "states": state or None,
         "priorities": priority or None,
     }
-    results = await retrieve.search_viewer_issues(pool, filters=filters, limit=limit)
-    items = [IssueSearchItem.model_validate(item) for item in results]
-    return IssueSearchResponse(items=items)
+    # The page is fetched before any bytes are sent, so database or projection
+    # errors surface as a normal error response rather than truncated JSON.
+    rows = await retrieve.search_viewer_issues(pool, filters=filters, limit=limit)
+    # Items keep full validation because origin_url must still be parsed as an
+    # HttpUrl; the validated page is then dumped by the same adapter.
+    items = _SEARCH_ITEMS.validate_python(rows)
+    return Response(content=b'{"items":' + _SEARCH_ITEMS.dump_json(items) + b"}", media_type="application/json")
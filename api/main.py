@@ -1,31 +1,132 @@
 """FastAPI application wiring the ingestion, retrieval, and triage flows."""
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 
 import asyncpg
 import numpy as np
+import orjson
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
+from .clients import github as github_clients
+from .clients import jira as jira_clients
 from .clients.github import GitHubClient
 from .clients.jira import JiraClient
 from .schemas import ProposalApproval, SearchResponse, TriageProposal, TriageRequest
 from . import sandbox
-from .services import embeddings, retrieve, rerank, triage
+from .services import embeddings, rerank, retrieve, triage
 from .webhooks import github as github_webhooks
 from .webhooks import jira as jira_webhooks
 from .http import viewer as viewer_http
+from api.utils.db_codecs import register_json_codecs, register_vector_codecs
 from api.utils.logging_utils import get_logger, logging_context, setup_logging
 
 setup_logging()
 logger = get_logger("api.main")
 
+# Upper bound on the number of queued /search queries encoded in one model call.
+EMBED_BATCH_MAX = 32
+# Dedicated query-encoding thread: the single embed worker runs one batch at a time,
+# and a private executor keeps it from queueing behind other executor work.
+EMBED_EXECUTOR_WORKERS = 1
+SEARCH_CACHE_TTL_SECONDS = 60
+# How long a successful database ping keeps /readyz answering without I/O.
+READY_CACHE_SECONDS = 5.0
+
+
+async def _embed_worker(app: FastAPI) -> None:
+    """Coalesce queued search queries into batched ``encode_texts`` calls."""
+
+    queue: asyncio.Queue[tuple[str, asyncio.Future]] = app.state.embed_queue
+    executor: ThreadPoolExecutor = app.state.embed_executor
+    loop = asyncio.get_running_loop()
+    while True:
+        items = [await queue.get()]
+        try:
+            while len(items) < EMBED_BATCH_MAX:
+                items.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            pass
+        texts = [text for text, _ in items]
+        try:
+            vectors = await loop.run_in_executor(executor, embeddings.encode_queries, texts)
+        except Exception as exc:  # noqa: BLE001 - surfaced to each waiting request
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(exc)
+            continue
+        with logging_context(component="embed_worker", batch_size=len(items)):
+            logger.debug("Encoded search query batch")
+        for (_, future), vector in zip(items, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+
+# Hot-path statements prepared on first use by each pooled connection.
+_PREPARED_SQL: dict[str, str] = {
+    "issue_with_vector": """
+        SELECT i.title, i.body, v.embedding, v.model
+        FROM issues i
+        LEFT JOIN LATERAL (
+            SELECT embedding, model
+            FROM issue_vectors
+            WHERE issue_id = i.id
+            ORDER BY updated_at DESC
+            LIMIT 1
+        ) v ON TRUE
+        WHERE i.id = $1
+    """,
+    "issue_meta": "SELECT source, repo, project, external_key, raw_json FROM issues WHERE id = $1",
+}
+
+
+class TriageConnection(asyncpg.Connection):
+    """asyncpg connection carrying the API's prepared hot-path statements."""
+
+    prepared: dict[str, asyncpg.prepared_stmt.PreparedStatement]
+
+
+async def _init_conn(conn: TriageConnection) -> None:
+    await register_json_codecs(conn)
+    # pgvector may not be installed yet on a fresh database; the lifespan
+    # expires the pool after the sandbox bootstrap so connections re-register.
+    if await conn.fetchval("SELECT to_regtype('halfvec')") is not None:
+        await register_vector_codecs(conn)
+    # Statements are prepared lazily so a pool can open before the schema exists.
+    conn.prepared = {}
+
+
+async def _fetchrow_prepared(pool: asyncpg.Pool, name: str, *args: Any) -> asyncpg.Record | None:
+    """Run a prepared hot-path statement, holding a pool connection only for the query."""
+
+    async with pool.acquire() as conn:
+        statement = conn.prepared.get(name)
+        if statement is None:
+            statement = conn.prepared[name] = await conn.prepare(_PREPARED_SQL[name])
+        return await statement.fetchrow(*args)
+
+
+def _search_cache_key(q: str, k: int, hybrid_mode: bool, alpha: float) -> str:
+    digest = hashlib.blake2b(f"{q}|{k}|{hybrid_mode}|{alpha}".encode(), digest_size=16).hexdigest()
+    return f"srch:{digest}"
+
+
+async def _embed_query(app: FastAPI, text: str) -> np.ndarray:
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    await app.state.embed_queue.put((text, future))
+    return await future
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -35,7 +136,12 @@ async def lifespan(app: FastAPI):
     redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
     with logging_context(component="api", event="startup"):
         logger.info("Initializing API dependencies")
-    db_pool = await asyncpg.create_pool(dsn=database_url)
+    db_pool = await asyncpg.create_pool(
+        dsn=database_url,
+        connection_class=TriageConnection,
+        init=_init_conn,
+        statement_cache_size=1024,
+    )
     redis = aioredis.from_url(redis_url, encoding="utf-8", decode_responses=True)
 
     app.state.db_pool = db_pool
@@ -47,28 +153,54 @@ async def lifespan(app: FastAPI):
     app.state.jira_base_url = os.getenv("JIRA_BASE_URL", "")
     app.state.jira_email = os.getenv("JIRA_EMAIL", "")
     app.state.jira_token = os.getenv("JIRA_API_TOKEN", "")
-    app.state.json_loads = json.loads
+    app.state.json_loads = orjson.loads
+    app.state.github_client = GitHubClient(token=app.state.github_token)
+    app.state.jira_client = (
+        JiraClient(
+            base_url=app.state.jira_base_url,
+            email=app.state.jira_email,
+            api_token=app.state.jira_token,
+        )
+        if app.state.jira_base_url
+        else None
+    )
+    app.state.embed_queue = asyncio.Queue()
+    app.state.embed_executor = ThreadPoolExecutor(
+        max_workers=EMBED_EXECUTOR_WORKERS,
+        thread_name_prefix="embed",
+    )
+    app.state.last_ready_ok = 0.0
     sandbox_enabled = os.getenv("SANDBOX_BOOTSTRAP", "1").lower() not in {"0", "false", "no"}
     if sandbox_enabled:
         data_dir_raw = os.getenv("SANDBOX_DATA_DIR")
         data_dir = Path(data_dir_raw) if data_dir_raw else sandbox.DEFAULT_DATA_DIR
         with logging_context(component="api", event="sandbox_bootstrap", data_dir=str(data_dir)):
             try:
-                await sandbox.ensure_sample_data(db_pool, data_dir=data_dir)
+                await sandbox.ensure_sample_data(db_pool, data_dir=data_dir, redis=app.state.redis)
                 await sandbox.ensure_embeddings(db_pool)
             except Exception:
                 logger.exception("Failed to bootstrap sandbox data")
+        # Connections opened before pgvector existed lack the vector codecs.
+        await db_pool.expire_connections()
 
+    embed_task = asyncio.create_task(_embed_worker(app))
     try:
         yield
     finally:
         with logging_context(component="api", event="shutdown"):
             logger.info("Shutting down API dependencies")
+        embed_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await embed_task
+        app.state.embed_executor.shutdown(wait=False, cancel_futures=True)
+        await app.state.github_client.close()
+        if app.state.jira_client is not None:
+            await app.state.jira_client.close()
         await app.state.db_pool.close()
         await app.state.redis.aclose()
 
 
-app = FastAPI(title="RAG issue Triage Copilot", lifespan=lifespan)
+app = FastAPI(title="RAG issue Triage Copilot", lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(github_webhooks.router)
 app.include_router(jira_webhooks.router)
 app.include_router(viewer_http.router)
@@ -86,31 +218,60 @@ async def get_db_pool(request: Request) -> asyncpg.Pool:
     return request.app.state.db_pool
 
 
+@app.get("/livez")
+async def liveness() -> dict[str, Any]:
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
 @app.get("/healthz")
 async def healthcheck(request: Request) -> dict[str, Any]:
+    now = time.monotonic()
+    if now - request.app.state.last_ready_ok < READY_CACHE_SECONDS:
+        return {"status": "ok"}
     pool: asyncpg.Pool = request.app.state.db_pool
-    async with pool.acquire() as conn:
-        await conn.execute("SELECT 1")
+    await pool.execute("SELECT 1")
+    request.app.state.last_ready_ok = time.monotonic()
     return {"status": "ok"}
 
 
 @app.get("/search", response_model=SearchResponse)
 async def search(
+        request: Request,
         q: str = Query(..., min_length=2),
         k: int = Query(10, ge=1, le=50),
         hybrid_mode: bool = Query(False, alias="hybrid"),
         alpha: float = Query(0.5, ge=0.0, le=1.0),
         pool: asyncpg.Pool = Depends(get_db_pool),
-) -> SearchResponse:
+) -> Response:
+    # Both paths return a ready JSON Response: FastAPI then skips re-validating
+    # the body against ``response_model``, which is kept for the OpenAPI schema.
     with logging_context(route="/search", query=q, hybrid=hybrid_mode, limit=k):
         logger.info("Processing search request")
-        embedding = embeddings.encode_texts([q])[0]
+        redis = request.app.state.redis
+        cache_key = _search_cache_key(q, k, hybrid_mode, alpha)
+        # The cache is best-effort: a Redis outage falls through to a live search.
+        try:
+            cached = await redis.get(cache_key)
+        except RedisError:
+            logger.exception("Search cache read failed")
+            cached = None
+        if cached:
+            logger.info("Search served from cache")
+            return Response(content=cached, media_type="application/json")
+        embedding = await _embed_query(request.app, q)
         if hybrid_mode:
             results = await retrieve.hybrid_search(pool, embedding, q, limit=k, alpha=alpha)
         else:
             results = await retrieve.vector_search(pool, embedding, limit=k)
         logger.info("Search completed", extra={"context": {"result_count": len(results)}})
-        return SearchResponse(query=q, results=results)
+        # The retrieve service already returns validated RetrievalResult models.
+        payload = SearchResponse.model_construct(query=q, results=tuple(results)).model_dump_json()
+        try:
+            await redis.setex(cache_key, SEARCH_CACHE_TTL_SECONDS, payload)
+        except RedisError:
+            logger.exception("Search cache write failed")
+        return Response(content=payload, media_type="application/json")
 
 
 @app.post("/triage/propose", response_model=TriageProposal)
@@ -118,39 +279,13 @@ async def propose_triage(
         payload: TriageRequest,
         pool: asyncpg.Pool = Depends(get_db_pool),
 ) -> TriageProposal:
-    async with pool.acquire() as conn:
-        record = await conn.fetchrow(
-            "SELECT title, body FROM issues WHERE id = $1",
-            payload.issue_id,
-        )
-        if record is None:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="issue not found")
-        vector_record = await conn.fetchrow(
-            """
-            SELECT embedding, model
-            FROM issue_vectors
-            WHERE issue_id = $1
-            ORDER BY updated_at DESC
-            LIMIT 1
-            """,
-            payload.issue_id,
-        )
-    if vector_record:
-        embedding_value = vector_record["embedding"]
-        if isinstance(embedding_value, str):
-            try:
-                embedding_value = json.loads(embedding_value)
-            except json.JSONDecodeError as exc:
-                logger.exception("FAiled to decode stored embedding as JSON")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="stored embedding is not valid JSON",
-                ) from exc
-        if isinstance(embedding_value, (bytes, bytearray, memoryview)):
-            embedding = np.frombuffer(embedding_value, dtype=np.float32).copy()
-        else:
-            embedding = np.array(embedding_value, dtype=np.float32)
-        model_name = vector_record["model"]
+    record = await _fetchrow_prepared(pool, "issue_with_vector", payload.issue_id)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="issue not found")
+    if record["embedding"] is not None:
+        # The halfvec codec registered in _init_conn already yields a float16 ndarray.
+        embedding = record["embedding"]
+        model_name = record["model"]
     else:
         embedding = embeddings.embedding_for_issue(record["title"], record["body"])
         model_name = embeddings.DEFAULT_MODEL
@@ -170,34 +305,14 @@ async def propose_triage(
 @app.post("/triage/approve")
 async def approve_triage(
         payload: ProposalApproval,
+        request: Request,
         pool: asyncpg.Pool = Depends(get_db_pool)
 ) -> dict[str, Any]:
-    async with pool.acquire() as conn:
-        record = await conn.fetchrow(
-            "SELECT source, repo, project, external_key, raw_json FROM issues WHERE id = $1",
-            payload.issue_id,
-        )
+    record = await _fetchrow_prepared(pool, "issue_meta", payload.issue_id)
     if record is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="issue not found")
+    # The jsonb codec registered in _init_conn already decodes raw_json to a dict.
     raw = record["raw_json"] or {}
-    if isinstance(raw, str):
-        try:
-            raw = app.state.json_loads(raw)
-        except json.JSONDecodeError as exc:
-            logger.exception("Failed to decode stored raw issue payload as JSON")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="stored issue payload is not valid JSON",
-            ) from exc
-    elif isinstance(raw, (bytes, bytearray, memoryview)):
-        try:
-            raw = app.state.json_loads(bytes(raw).decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-            logger.exception("Failed to decode stored raw issue payload from bytes")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="stored issue payload is not valid JSON"
-            ) from exc
     record_source = str(record["source"] or "").lower()
     requested_source = str(payload.source or record_source).lower()
 
@@ -206,35 +321,46 @@ async def approve_triage(
         number = raw.get("issue", {}).get("number") or raw.get("number")
         if not (repo and number):
             raise HTTPException(status_code=400, detail="missing repo or number")
-        client = GitHubClient(token=app.state.github_token)
-        try:
+        state = request.app.state
+        async with github_clients.with_client(
+                state.github_token,
+                existing=getattr(state, "github_client", None),
+        ) as client:
             with logging_context(route="/triage/approve", source="github", repo=repo, number=number):
                 logger.info("Applying GitHub triage actions")
+                # POST .../labels and .../assignees add to the existing lists; a PATCH
+                # of the issue would replace them.
+                tasks = []
                 if payload.labels:
-                    await client.add_labels(repo, number, payload.labels)
+                    tasks.append(client.add_labels(repo, number, payload.labels))
                 if payload.assignee:
-                    await client.assign_issue(repo, number, [payload.assignee])
+                    tasks.append(client.assign_issue(repo, number, [payload.assignee]))
                 if payload.comment:
-                    await client.create_comment(repo, number, payload.comment)
-        finally:
-            await client.close()
+                    tasks.append(client.create_comment(repo, number, payload.comment))
+                if tasks:
+                    await asyncio.gather(*tasks)
     elif requested_source == "jira" and record_source == "jira":
-        base_url = app.state.jira_base_url
-        if not base_url:
+        state = request.app.state
+        if not state.jira_base_url:
             raise HTTPException(status_code=400, detail="jira base url missing")
-        client = JiraClient(base_url=base_url, email=app.state.jira_email, api_token=app.state.jira_token)
         key = raw.get("issue", {}).get("key") or raw.get("key")
         if not key:
             raise HTTPException(status_code=400, detail="missing jira key")
-        try:
+        async with jira_clients.with_client(
+                state.jira_base_url,
+                state.jira_email,
+                state.jira_token,
+                existing=getattr(state, "jira_client", None),
+        ) as client:
             with logging_context(route="/triage/approve", source="jira", issue_key=key):
                 logger.info("Applying Jira triage actions")
+                tasks = []
                 if payload.assignee:
-                    await client.assign(key, payload.assignee)
+                    tasks.append(client.assign(key, payload.assignee))
                 if payload.comment:
-                    await client.add_comment(key, payload.comment)
-        finally:
-            await client.close()
+                    tasks.append(client.add_comment(key, payload.comment))
+                if tasks:
+                    await asyncio.gather(*tasks)
     else:
         raise HTTPException(status_code=400, detail="source mismatch")
     return {"ok": True}
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional, Sequence, Tuple
+from typing import Any, Optional, Tuple
 from dataclasses import field
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl
 
 
 class IssuePayload(BaseModel):
@@ -29,6 +29,8 @@ class EmbedJob(BaseModel):
 
 
 class RetrievalResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     issue_id: int
     title: str
     summary: Optional[str] = None
@@ -53,8 +55,10 @@ class ProposalApproval(BaseModel):
 
 
 class SearchResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     query: str
-    results: Sequence[RetrievalResult]
+    results: Tuple[RetrievalResult, ...]
 
 
 class HealthResponse(BaseModel):
@@ -85,13 +89,15 @@ class IssueViewerRecord(BaseModel):
     project: Optional[str] = None
     status: Optional[str] = None
     priority: Optional[str] = None
-    labels: list[str] = field(default_factory=list)
+    labels: Tuple[str, ...] = ()
     created_at: Optional[datetime] = None
     determinism: str
     comments: list[IssueViewerComment] = field(default_factory=list)
 
 
 class IssueSearchItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     source: str
     route: str
@@ -99,7 +105,7 @@ class IssueSearchItem(BaseModel):
     title: str
     status: Optional[str] = None
     priority: Optional[str] = None
-    labels: list[str] = field(default_factory=list)
+    labels: Tuple[str, ...] = ()
     repo: Optional[str] = None
     project: Optional[str] = None
     created_at: Optional[datetime] = None
@@ -1,50 +1,240 @@
 """Embedding utilities built on top of sentence-transformers for GitHub issue text."""
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
 
 import numpy as np
 
-try: # pragma: no cover - exercised indirectly in tests
-    from sentence_transformers import SentenceTransformer
-except ModuleNotFoundError:     # pragma: no cover - optional dependency
-    SentenceTransformer = None  # type: ignore[assignment]
-
-
 from api.utils.logging_utils import get_logger, logging_context
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sentence_transformers import SentenceTransformer as _SentenceTransformer
+
 logger = get_logger("api.services.embeddings")
 
+# Resolved on first ``get_model`` call: importing sentence-transformers pulls in
+# torch/transformers, which would otherwise load in every process importing this
+# module (webhook handlers, the viewer API, the sandbox CLI).
+SentenceTransformer: Any = None
+
 DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+QUERY_CACHE_SIZE = 4096
+ISSUE_CACHE_SIZE = 4096
+ENCODE_BATCH_SIZE = 64
+EMBEDDING_DTYPE = np.float16
+# "torch" (default), "onnx" or "openvino"; the compiled runtimes fuse the
+# encoder's LayerNorm/GELU/attention ops and are markedly faster on CPU.
+EMBED_BACKEND = os.getenv("EMBED_BACKEND", "torch").lower()
+# Optional ONNX/OpenVINO file inside the model repo, e.g. "onnx/model_O3.onnx".
+EMBED_MODEL_FILE = os.getenv("EMBED_MODEL_FILE", "")
+# "int8" selects the dynamically quantized ONNX export (see quantize_model),
+# which runs on VNNI int8 dot-product instructions where the CPU has them.
+EMBED_QUANT = os.getenv("EMBED_QUANT", "").lower()
+INT8_ONNX_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+_query_cache: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+_query_cache_lock = threading.Lock()
+# Keyed by a 16-byte digest of the issue text so the cache does not pin whole
+# issue bodies in memory.
+_issue_cache: OrderedDict[tuple[str, bytes], np.ndarray] = OrderedDict()
+_issue_cache_lock = threading.Lock()
 
 
 @lru_cache(maxsize=1)
-def get_model(model_name: str = DEFAULT_MODEL) -> SentenceTransformer:
+def get_model(model_name: str = DEFAULT_MODEL) -> _SentenceTransformer:
+    global SentenceTransformer
     if SentenceTransformer is None:
-        raise ModuleNotFoundError(
-            "sentence-transformers must be installed to load embedding models"
-        )
-    with logging_context(component="embeddings", model=model_name):
+        try: # pragma: no cover - exercised indirectly in tests
+            from sentence_transformers import SentenceTransformer
+        except ModuleNotFoundError as exc:     # pragma: no cover - optional dependency
+            raise ModuleNotFoundError(
+                "sentence-transformers must be installed to load embedding models"
+            ) from exc
+    with logging_context(component="embeddings", model=model_name, backend=EMBED_BACKEND):
         logger.info("Loading embedding model")
-    return SentenceTransformer(model_name)
+    if EMBED_QUANT and EMBED_BACKEND != "onnx":
+        with logging_context(component="embeddings", quant=EMBED_QUANT, backend=EMBED_BACKEND):
+            logger.warning("EMBED_QUANT only applies to EMBED_BACKEND=onnx; ignoring it")
+    if EMBED_BACKEND == "torch":
+        return SentenceTransformer(model_name)
+    model_kwargs: dict[str, Any] = {}
+    if EMBED_BACKEND == "onnx":
+        model_kwargs["provider"] = "CPUExecutionProvider"
+    file_name = _model_file()
+    if file_name:
+        model_kwargs["file_name"] = file_name
+    return SentenceTransformer(model_name, backend=EMBED_BACKEND, model_kwargs=model_kwargs)
 
 
-def encode_texts(texts: Iterable[str], model_name: str = DEFAULT_MODEL) -> np.ndarray:
-    items: Sequence[str] = tuple(texts)
+def _cpu_supports_vnni() -> bool:
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return False
+    return "avx512_vnni" in cpuinfo or "avx_vnni" in cpuinfo
+
+
+def _model_file() -> str:
+    if EMBED_MODEL_FILE:
+        return EMBED_MODEL_FILE
+    if EMBED_QUANT == "int8" and EMBED_BACKEND == "onnx":
+        if _cpu_supports_vnni():
+            return INT8_ONNX_FILE
+        with logging_context(component="embeddings", quant=EMBED_QUANT):
+            logger.warning("CPU lacks VNNI; falling back to the fp32 ONNX model")
+    return ""
+
+
+def quantize_model(output_dir: str | Path, model_name: str = DEFAULT_MODEL) -> Path:
+    """Save ``model_name`` with a dynamically int8-quantized ONNX export to ``output_dir``.
+
+    ``output_dir`` is written as a complete local model (config, tokenizer and
+    ``onnx/model_qint8_avx512_vnni.onnx``), so it never shadows a hub id. Load
+    it by passing the directory as the model name with ``EMBED_BACKEND=onnx``
+    and either ``EMBED_QUANT=int8`` (VNNI hosts only) or
+    ``EMBED_MODEL_FILE=onnx/model_qint8_avx512_vnni.onnx``. Run once per host.
+    """
+
+    from sentence_transformers import (
+        SentenceTransformer as _SentenceTransformer,
+        export_dynamic_quantized_onnx_model,
+    )
+
+    target = Path(output_dir)
+    model = _SentenceTransformer(model_name, backend="onnx")
+    model.save(str(target))
+    export_dynamic_quantized_onnx_model(model, "avx512_vnni", str(target))
+    return target / INT8_ONNX_FILE
+
+
+def encode_texts(
+        texts: Iterable[str],
+        model_name: str = DEFAULT_MODEL,
+        *,
+        batch_size: int = ENCODE_BATCH_SIZE,
+        dtype: np.dtype | type[np.floating] = EMBEDDING_DTYPE,
+        show_progress_bar: bool = False,
+) -> np.ndarray:
+    """Encode ``texts`` in caller order using length-sorted ("smart") batches.
+
+    Inputs are sorted longest-first so each model call pads only to its own
+    longest item, then the rows are scattered back to their original positions.
+    Rows are normalized, so ``float16`` (the default, matching ``halfvec``
+    storage) keeps cosine/dot-product scores accurate at half the bytes.
+    """
+
+    # Lists/tuples are indexed in place; only one-shot iterables are copied.
+    items: Sequence[str] = texts if isinstance(texts, Sequence) else tuple(texts)
     model = get_model(model_name)
     if not items:
-        return np.empty((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
-    embeddings = model.encode(
-        list(items),
-        convert_to_numpy=True,
-        show_progress_bar=True,
-        normalize_embeddings=True,
-    )
-    return np.asarray(embeddings, dtype=np.float32, copy=False)
+        return np.empty((0, model.get_sentence_embedding_dimension()), dtype=dtype)
+    if len(items) == 1:
+        # Single-issue encodes are the common webhook/worker case; skip the
+        # sort/scatter bookkeeping entirely.
+        embedding = model.encode(
+            [items[0]],
+            batch_size=1,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+            normalize_embeddings=True,
+        )
+        return embedding.astype(dtype, copy=False)
+    # Character length is a cheap, monotone-enough proxy for token count.
+    order = np.argsort([-len(text) for text in items], kind="stable")
+    out: np.ndarray | None = None
+    for start in range(0, len(items), batch_size):
+        chunk = order[start : start + batch_size]
+        embeddings = model.encode(
+            [items[index] for index in chunk],
+            batch_size=len(chunk),
+            convert_to_numpy=True,
+            show_progress_bar=show_progress_bar,
+            normalize_embeddings=True,
+        )
+        # Assigning into ``out`` casts in place; no intermediate astype copy.
+        if out is None:
+            out = np.empty((len(items), embeddings.shape[1]), dtype=dtype)
+        out[chunk] = embeddings
+    return out
+
+
+def embeddings_for_issues(
+        pairs: Iterable[tuple[str, str]],
+        model_name: str = DEFAULT_MODEL,
+) -> np.ndarray:
+    """Return ``EMBEDDING_DTYPE`` embeddings for ``(title, body)`` pairs from one encode call."""
+    texts = [f"{title}\n\n{body}".strip() for title, body in pairs]
+    return encode_texts(texts, model_name=model_name)
 
 
 def embedding_for_issue(title: str, body: str, model_name: str = DEFAULT_MODEL) -> np.ndarray:
+    """Return the issue embedding as ``EMBEDDING_DTYPE``, matching the ``halfvec`` storage type.
+
+    Results are memoized by content digest, so re-triaging or re-embedding an
+    unchanged issue skips the model. Cached vectors are read-only.
+    """
     text = f"{title}\n\n{body}".strip()
-    embedding = encode_texts([text], model_name=model_name)
-    return embedding[0]
+    key = (model_name, hashlib.blake2b(text.encode(), digest_size=16).digest())
+    with _issue_cache_lock:
+        cached = _issue_cache.get(key)
+        if cached is not None:
+            _issue_cache.move_to_end(key)
+            return cached
+    vector = encode_texts([text], model_name=model_name)[0].copy()
+    vector.setflags(write=False)
+    with _issue_cache_lock:
+        _issue_cache[key] = vector
+        while len(_issue_cache) > ISSUE_CACHE_SIZE:
+            _issue_cache.popitem(last=False)
+    return vector
+
+
+def encode_queries(texts: Iterable[str], model_name: str = DEFAULT_MODEL) -> np.ndarray:
+    """Encode search queries, serving repeated strings from an in-process LRU.
+
+    Only cache misses reach the model, and they are encoded together in a single
+    :func:`encode_texts` call. Cached vectors are read-only.
+    """
+
+    items: Sequence[str] = tuple(texts)
+    if not items:
+        return encode_texts(items, model_name=model_name)
+    found: dict[str, np.ndarray] = {}
+    with _query_cache_lock:
+        for text in items:
+            cached = _query_cache.get((model_name, text))
+            if cached is not None:
+                _query_cache.move_to_end((model_name, text))
+                found[text] = cached
+    misses = [text for text in dict.fromkeys(items) if text not in found]
+    if misses:
+        encoded = encode_texts(misses, model_name=model_name)
+        with _query_cache_lock:
+            for text, vector in zip(misses, encoded):
+                vector = vector.copy()
+                vector.setflags(write=False)
+                _query_cache[(model_name, text)] = vector
+                found[text] = vector
+            while len(_query_cache) > QUERY_CACHE_SIZE:
+                _query_cache.popitem(last=False)
+    return np.stack([found[text] for text in items])
+
+
+def clear_query_cache() -> None:
+    """Drop all cached query embeddings."""
+
+    with _query_cache_lock:
+        _query_cache.clear()
+
+
+def clear_issue_cache() -> None:
+    """Drop all cached issue embeddings."""
+
+    with _issue_cache_lock:
+        _issue_cache.clear()
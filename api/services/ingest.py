@@ -8,6 +8,7 @@ from typing import Any
 import asyncpg
 
 from ..schemas import IssuePayload
+from .retrieve import ROUTES_CACHE_KEY
 
 from api.utils.logging_utils import get_logger, logging_context
 
@@ -43,7 +44,8 @@ async def store_issue(pool: asyncpg.Pool, issue: IssuePayload) -> int:
             issue.project,
             issue.status,
             created_at,
-            json.dumps(issue.raw_json, ensure_ascii=False),
+            # The pool's json codec serializes the payload with orjson.
+            issue.raw_json,
         )
     if record is None:
         raise RuntimeError("Failed to upsert issue payload")
@@ -102,3 +104,7 @@ async def enqueue_embedding_job(redis, issue_id: int, force: bool = False) -> No
     await redis.rpush("triage:embed", payload)
     with logging_context(issue_id=issue_id):
         logger.debug("Enqueued embedding job")
+
+async def invalidate_routes_cache(redis) -> None:
+    """Drop the cached viewer routes so the next ``/api/routes`` call rebuilds them."""
+    await redis.delete(ROUTES_CACHE_KEY)
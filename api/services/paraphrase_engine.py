@@ -11,6 +11,8 @@ from __future__ import annotations
 import os
 import re
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
@@ -20,6 +22,11 @@ ReplacementList = List[Tuple[str, str]]
 
 logger = get_logger("api.services.paraphrase_engine")
 
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Upper bound on in-flight Hugging Face requests for one paraphrase batch.
+HF_BATCH_CONCURRENCY = 8
+
 
 @dataclass
 class ParaphraseResult:
@@ -43,7 +50,13 @@ class ParaphraseResult:
 def _tokenize(text: str) -> List[str]:
     """Return a simple word-token list used for diff-style accounting."""
 
-    return re.findall(r"\b\w+\b", text)
+    return _WORD_RE.findall(text)
+
+
+def _word_count(text: str) -> int:
+    """Return the number of word tokens in ``text`` without building a list."""
+
+    return sum(1 for _ in _WORD_RE.finditer(text))
 
 
 def _count_token_edits(source: Sequence[str], target: Sequence[str]) -> int:
@@ -131,23 +144,25 @@ class LockedEntityGuard:
             pairs which can later be passed to :meth:`unmask`.
         """
 
+        # Earlier patterns win: a match is kept only if it does not overlap a
+        # span accepted before it. ``spans`` stays sorted by start, so checking
+        # the neighbours found by bisection replaces a scan of every span.
+        starts: List[int] = []
         spans: List[Tuple[int, int, str]] = []
         for pattern in self._patterns:
             for match in pattern.finditer(text):
                 start, end = match.span()
                 if start == end:
                     continue
-                overlap = False
-                for existing_start, existing_end, _ in spans:
-                    if not (end <= existing_start or start >= existing_end):
-                        overlap = True
-                        break
-                if overlap:
+                idx = bisect_right(starts, start)
+                if idx and spans[idx - 1][1] > start:
+                    continue
+                if idx < len(spans) and spans[idx][0] < end:
                     continue
-                spans.append((start, end, match.group(0)))
+                starts.insert(idx, start)
+                spans.insert(idx, (start, end, match.group(0)))
         if not spans:
             return text, []
-        spans.sort(key=lambda item: item[0])
         result_parts: List[str] = []
         cursor = 0
         replacements: List[Tuple[str, str]] = []
@@ -201,7 +216,22 @@ class BaseParaphraser:
         method while respecting the budgeting helpers.
         """
 
-        return ParaphraseResult(text=text, edited_tokens=0, total_tokens=len(_tokenize(text)))
+        return ParaphraseResult(text=text, edited_tokens=0, total_tokens=_word_count(text))
+
+    def paraphrase_batch(
+            self,
+            texts: Sequence[str],
+            constraints: Optional[Sequence[Optional[dict]]] = None,
+    ) -> List[ParaphraseResult]:
+        """Paraphrase several ``texts`` at once, one result per input.
+
+        ``constraints`` is either ``None`` or aligned with ``texts``. The base
+        implementation simply loops; model-backed subclasses override it to
+        issue their requests together.
+        """
+
+        per_text = constraints if constraints is not None else [None] * len(texts)
+        return [self.paraphrase(text, constraints=item) for text, item in zip(texts, per_text)]
 
 
 class LLMParaphraser(BaseParaphraser, ABC):
@@ -217,13 +247,49 @@ class LLMParaphraser(BaseParaphraser, ABC):
     def paraphrase(self, text: str, constraints: Optional[Dict[str, Any]] = None, seed: str = "") -> ParaphraseResult:
         """Delegate to :meth:`generate` while enforcing the edit budget."""
 
-        tokens = _tokenize(text)
-        total_tokens = len(tokens)
         if not text.strip():
-            return ParaphraseResult(text=text, edited_tokens=0, total_tokens=total_tokens)
+            return ParaphraseResult(text=text, edited_tokens=0, total_tokens=_word_count(text))
         generated = self.generate(text=text, constraints=constraints or {}, seed=seed)
-        target_tokens = _tokenize(generated)
-        edits = _count_token_edits(tokens, target_tokens)
+        return self._check_budget(text, generated)
+
+    def generate_batch(
+            self,
+            texts: Sequence[str],
+            constraints: Sequence[Dict[str, Any]],
+            seed: str,
+    ) -> List[str]:
+        """Produce paraphrased candidates for ``texts``, preserving order."""
+
+        return [self.generate(text=text, constraints=item, seed=seed) for text, item in zip(texts, constraints)]
+
+    def paraphrase_batch(
+            self,
+            texts: Sequence[str],
+            constraints: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+            seed: str = "",
+    ) -> List[ParaphraseResult]:
+        """Generate candidates for all non-blank ``texts`` in one :meth:`generate_batch` call."""
+
+        per_text = constraints if constraints is not None else [None] * len(texts)
+        pending = [idx for idx, text in enumerate(texts) if text.strip()]
+        generated = self.generate_batch(
+            [texts[idx] for idx in pending],
+            [per_text[idx] or {} for idx in pending],
+            seed,
+        )
+        results = [
+            ParaphraseResult(text=text, edited_tokens=0, total_tokens=_word_count(text)) for text in texts
+        ]
+        for idx, candidate in zip(pending, generated):
+            results[idx] = self._check_budget(texts[idx], candidate)
+        return results
+
+    def _check_budget(self, text: str, generated: str) -> ParaphraseResult:
+        """Accept ``generated`` only if its token edits fit the budget."""
+
+        tokens = _tokenize(text)
+        total_tokens = len(tokens)
+        edits = _count_token_edits(tokens, _tokenize(generated))
         allowed = self._allowed_edits(total_tokens)
         if edits > allowed:
             return ParaphraseResult(text=text, edited_tokens=0, total_tokens=total_tokens)
@@ -267,12 +333,19 @@ class HFApiParaphraser(LLMParaphraser):
         protected = constraints.get("do_not_change") if constraints else None
         if not protected:
             return text, []
-        replacements: ReplacementList = []
-        updated = text
-        for idx, item in enumerate(protected):
-            placeholder = f"\uf8fd{idx}\uf8fc"
-            replacements.append((placeholder, item))
-            updated = updated.replace(item, placeholder)
+        placeholders: Dict[str, str] = {}
+        for item in protected:
+            if item and item not in placeholders:
+                placeholders[item] = f"\uf8fd{len(placeholders)}\uf8fc"
+        if not placeholders:
+            return text, []
+        # One alternation, longest first, replaces every protected span in a
+        # single scan instead of one str.replace pass per item.
+        pattern = re.compile(
+            "|".join(re.escape(item) for item in sorted(placeholders, key=len, reverse=True))
+        )
+        updated = pattern.sub(lambda match: placeholders[match.group(0)], text)
+        replacements: ReplacementList = [(placeholder, item) for item, placeholder in placeholders.items()]
         return updated, replacements
 
     def _restore_constraints(self, text: str, spans: Iterable[Tuple[str, str]]) -> str:
@@ -323,6 +396,26 @@ class HFApiParaphraser(LLMParaphraser):
             generated = generated.strip() or text
         return self._restore_constraints(generated, spans)
 
+    def generate_batch(
+            self,
+            texts: Sequence[str],
+            constraints: Sequence[Dict[str, Any]],
+            seed: str,
+    ) -> List[str]:
+        """Issue the inference requests for ``texts`` concurrently.
+
+        The hosted ``text_generation`` endpoint takes one prompt per request,
+        so batching here means overlapping the round trips rather than
+        sending a single payload.
+        """
+
+        if len(texts) <= 1:
+            return super().generate_batch(texts, constraints, seed)
+        with ThreadPoolExecutor(max_workers=min(HF_BATCH_CONCURRENCY, len(texts))) as executor:
+            return list(
+                executor.map(lambda text, item: self.generate(text=text, constraints=item, seed=seed), texts, constraints)
+            )
+
 class ProviderRegistry:
     """Factory helpers that produce configured paraphraser instances."""
 
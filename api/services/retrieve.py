@@ -11,6 +11,7 @@ from urllib.parse import urlparse
 
 import asyncpg
 import numpy as np
+import orjson
 
 from ..schemas import RetrievalResult
 from .embeddings import DEFAULT_MODEL
@@ -22,36 +23,38 @@ _GITHUB_ISSUE_RE = re.compile(r"^https://github\.com/([^/]+)/([^/]+)/issues/(\d+
 _JIRA_ISSUE_RE = re.compile(r"^https://([A-Za-z0-9-]+)\.atlassian\.net/browse/([A-Za-z0-9][A-Za-z0-9_-]*-\d+)(?:[?#/].*)?$", re.IGNORECASE)
 _URL_RE = re.compile(r"(https?://[^\s<>]+)")
 
+# Redis key holding the serialized ``/api/routes`` payload; ingestion deletes it.
+ROUTES_CACHE_KEY = "viewer:routes"
+ROUTES_CACHE_TTL_SECONDS = 300
 
-def _as_vector(embedding: np.ndarray | Iterable[float]) -> list[float]:
-    array = np.asarray(embedding, dtype=np.float32)
-    if array.ndim != 1:
-        array = array.reshape(-1)
-    return array.tolist()
 
+def _as_vector(embedding: np.ndarray | Iterable[float]) -> np.ndarray:
+    return np.ascontiguousarray(embedding, dtype=np.float32).reshape(-1)
 
-def _vector_literal(vector: Sequence[float]) -> str:
+
+def _vector_literal(vector: np.ndarray) -> str:
     """Serialize a vector for pgvector queries.
 
     asyncpg does not automatically coerce Python sequences to the pgvector type,
     so we emit the JSON representation that pgvector accepts, matching the
-    format used when persisting embeddings.
+    format used when persisting embeddings. orjson writes the float32 array
+    directly, without a ``tolist`` round trip through Python floats.
 
     :param vector:
     :return:
     """
 
-    return json.dumps([float(component) for component in vector], ensure_ascii=False, separators=(",", ":"))
+    return orjson.dumps(vector, option=orjson.OPT_SERIALIZE_NUMPY).decode()
 
 
 def _vector_sql_literal(vector: Sequence[float]) -> str:
-    """Return a SQL literal that casts the vector to the pgvector type."""
+    """Return a SQL literal that casts the vector to the pgvector ``halfvec`` type."""
 
     literal = _vector_literal(vector)
-    # json.dumps never produces single quotes, but double the character just in case
+    # JSON never contains single quotes, but double the character just in case
     # to remain safe when interpolating into SQL.
     escaped = literal.replace("'", "''")
-    return f"'{escaped}'::vector"
+    return f"'{escaped}'::halfvec"
 
 
 def _row_value(
@@ -794,6 +797,8 @@ async def search_viewer_issues(
     """
     params.append(limit)
 
+    # Fetch the whole (limit-bounded) page so the connection is back in the
+    # pool before the response starts.
     async with pool.acquire() as conn:
         rows = await conn.fetch(query, *params)
 
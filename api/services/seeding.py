@@ -1,17 +1,12 @@
 """Sandbox dataset seeding helpers."""
 from __future__ import annotations
 
-import hashlib
 import json
-import os
 from dataclasses import dataclass
 from itertools import count
 from pathlib import Path
-from typing import Any, Iterable, Literal, cast
+from typing import Any, Iterable, Literal
 
-import asyncpg
-
-from api.services.ingest import normalize_github_issue, normalize_jira_issue, store_issue
 from api.utils.logging_utils import get_logger
 
 logger = get_logger("api.services.seeding")
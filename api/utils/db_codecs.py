@@ -0,0 +1,145 @@
+"""asyncpg type codecs shared by the API, worker, and sandbox loaders.
+
+Embeddings are stored in pgvector ``halfvec`` columns (``vector`` on databases
+that predate ``migrate.sql``). Registering binary codecs lets asyncpg hand the
+raw payload straight to NumPy instead of parsing the textual ``[x, y, ...]``
+representation element by element. ``json``/``jsonb`` columns are decoded with
+orjson so callers receive dicts rather than strings to re-parse.
+"""
+from __future__ import annotations
+
+import struct
+from typing import Iterable
+
+import asyncpg
+import numpy as np
+import orjson
+
+__all__ = [
+    "decode_halfvec",
+    "decode_json",
+    "decode_jsonb",
+    "decode_vector",
+    "encode_halfvec",
+    "encode_json",
+    "encode_jsonb",
+    "encode_vector",
+    "register_json_codecs",
+    "register_vector_codecs",
+]
+
+# pgvector's binary wire format: uint16 dimension, uint16 (unused), then the
+# components in network byte order.
+_HEADER = struct.Struct(">HH")
+_HALFVEC_WIRE_DTYPE = np.dtype(">f2")
+_VECTOR_WIRE_DTYPE = np.dtype(">f4")
+
+
+def _encode(value: np.ndarray | Iterable[float] | str, wire_dtype: np.dtype) -> bytes:
+    # Strings are accepted in pgvector's JSON-style text form so callers that
+    # still serialize embeddings as text keep working against pools that have
+    # the codecs registered.
+    if isinstance(value, str):
+        value = orjson.loads(value)
+    array = np.asarray(value, dtype=wire_dtype).reshape(-1)
+    return _HEADER.pack(array.shape[0], 0) + array.tobytes()
+
+
+def _decode(data: bytes, wire_dtype: np.dtype, dtype: type[np.floating]) -> np.ndarray:
+    dim, _ = _HEADER.unpack_from(data)
+    wire = np.frombuffer(data, dtype=wire_dtype, count=dim, offset=_HEADER.size)
+    return wire.astype(dtype)
+
+
+def encode_halfvec(value: np.ndarray | Iterable[float] | str) -> bytes:
+    """Pack an embedding into pgvector's binary ``halfvec`` format."""
+
+    return _encode(value, _HALFVEC_WIRE_DTYPE)
+
+
+def decode_halfvec(data: bytes) -> np.ndarray:
+    """Return a native-endian ``float16`` array from a binary ``halfvec`` value."""
+
+    return _decode(data, _HALFVEC_WIRE_DTYPE, np.float16)
+
+
+def encode_vector(value: np.ndarray | Iterable[float] | str) -> bytes:
+    """Pack an embedding into pgvector's binary ``vector`` format."""
+
+    return _encode(value, _VECTOR_WIRE_DTYPE)
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    """Return a native-endian ``float32`` array from a binary ``vector`` value."""
+
+    return _decode(data, _VECTOR_WIRE_DTYPE, np.float32)
+
+
+async def register_vector_codecs(conn: asyncpg.Connection) -> None:
+    """Install the ``vector``/``halfvec`` codecs on ``conn`` (use as a pool ``init`` hook)."""
+
+    await conn.set_type_codec(
+        "vector",
+        schema="public",
+        encoder=encode_vector,
+        decoder=decode_vector,
+        format="binary",
+    )
+    await conn.set_type_codec(
+        "halfvec",
+        schema="public",
+        encoder=encode_halfvec,
+        decoder=decode_halfvec,
+        format="binary",
+    )
+
+
+# jsonb's binary representation is a one-byte format version followed by the
+# JSON text; plain json sends the text as-is. Binary codecs are required for
+# ``copy_records_to_table``, which always uses the binary COPY format.
+_JSONB_VERSION = b"\x01"
+
+
+def encode_json(value: object) -> bytes:
+    """Serialize a ``json`` parameter; pre-serialized strings are sent unchanged."""
+
+    if isinstance(value, str):
+        return value.encode()
+    return orjson.dumps(value)
+
+
+def decode_json(data: bytes) -> object:
+    """Decode a binary ``json`` column value with orjson."""
+
+    return orjson.loads(data)
+
+
+def encode_jsonb(value: object) -> bytes:
+    """Serialize a ``jsonb`` parameter in the binary wire format."""
+
+    return _JSONB_VERSION + encode_json(value)
+
+
+def decode_jsonb(data: bytes) -> object:
+    """Decode a binary ``jsonb`` column value with orjson."""
+
+    return orjson.loads(memoryview(data)[1:])
+
+
+async def register_json_codecs(conn: asyncpg.Connection) -> None:
+    """Decode ``json``/``jsonb`` columns to Python objects (use as a pool ``init`` hook)."""
+
+    await conn.set_type_codec(
+        "json",
+        schema="pg_catalog",
+        encoder=encode_json,
+        decoder=decode_json,
+        format="binary",
+    )
+    await conn.set_type_codec(
+        "jsonb",
+        schema="pg_catalog",
+        encoder=encode_jsonb,
+        decoder=decode_jsonb,
+        format="binary",
+    )
@@ -8,13 +8,14 @@ from __future__ import annotations
 
 import contextlib
 import contextvars
-import json
 import logging
 import os
 import sys
 import time
 from typing import Any, Dict, Iterable, Iterator, Mapping, MutableMapping, Optional
 
+import orjson
+
 __all__= [
     "setup_logging",
     "get_logger",
@@ -31,6 +32,14 @@ def _deepcopy_context(data: Mapping[str, Any]) -> Dict[str, Any]:
     """Return a shallow copy that is safe to mutate downstream."""
     return dict(data)
 
+def _format_timestamp(record: logging.LogRecord) -> str:
+    """Return the record's creation time as ``YYYY-MM-DDTHH:MM:SS.mmmZ`` (UTC)."""
+    t = time.gmtime(record.created)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{int(record.msecs):03d}Z"
+    )
+
 class JsonFormatter(logging.Formatter):
     """JSON formatter with consistent keys for ingestion pipelines."""
 
@@ -38,8 +47,7 @@ class JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:     # noqa: D401
         base: Dict[str, Any] = {
-            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%s", time.gmtime(record.created))
-            + f".{int(record.msecs):03d}z",
+            "timestamp": _format_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -52,7 +60,9 @@ class JsonFormatter(logging.Formatter):
             base["context"] = context
         if record.stack_info:
             base["stack"] = self.formatStack(record.stack_info)
-        return json.dumps(base, ensure_ascii=False)
+        # orjson encodes datetimes and UUIDs natively; anything else in the
+        # context falls back to ``str`` instead of failing the log call.
+        return orjson.dumps(base, default=str).decode()
 
 class ContextualAdapter(logging.LoggerAdapter):
     """LoggerAdapter that merges structured context with each record."""
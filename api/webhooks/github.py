@@ -44,6 +44,7 @@ async def handle_github(
             normalized = ingest.normalize_github_issue(payload)
             issue_id = await ingest.store_issue(pool, normalized)
             logger.info("Stored GitHub issue", extra={"context": {"issue_id": issue_id}})
+            await ingest.invalidate_routes_cache(redis)
             await ingest.enqueue_embedding_job(redis, issue_id)
         else:
             logger.info("Ignoring GitHub event")
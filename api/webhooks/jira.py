@@ -29,6 +29,7 @@ async def handle_jira(
         normalized = ingest.normalize_jira_issue(payload)
         issue_id = await ingest.store_issue(pool, normalized)
         logger.info("Stored Jira issue", extra={"context": {"issue_id": issue_id}})
+        await ingest.invalidate_routes_cache(redis)
         await ingest.enqueue_embedding_job(redis, issue_id)
     return {"ok": True}
 
@@ -21,7 +21,7 @@ CREATE TABLE IF NOT EXISTS issues (
 
 CREATE TABLE IF NOT EXISTS issue_vectors (
     issue_id INT PRIMARY KEY REFERENCES issues(id) ON DELETE CASCADE,
-    embedding VECTOR(384) NOT NULL,
+    embedding HALFVEC(384) NOT NULL,
     model TEXT NOT NULL,
     updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW()
 );
@@ -43,12 +43,12 @@ CREATE TABLE IF NOT EXISTS similar_issues (
 
 -- HNSW index for pgvector embeddings per pgvector docs
 CREATE INDEX IF NOT EXISTS issue_vectors_embedding_hnsw ON issue_vectors
-USING hnsw (embedding vector_l2_ops)
+USING hnsw (embedding halfvec_l2_ops)
 WITH (m = 16, ef_construction = 200);
 
 -- Optional IVF index for hybrid workloads
 CREATE INDEX IF NOT EXISTS issue_vectors_embedding_ivfflat ON issue_vectors
-USING ivfflat (embedding vector_l2_ops)
+USING ivfflat (embedding halfvec_l2_ops)
 WITH (lists = 100);
 
 CREATE INDEX IF NOT EXISTS issues_search_vector_idx ON issues USING GIN (search_vector);
\ No newline at end of file
@@ -1,2 +1,14 @@
 -- Placeholder migration script for any future schema changes.
--- Apply init.sql on first run, then append migrations here as needed
\ No newline at end of file
+-- Apply init.sql on first run, then append migrations here as needed
+
+-- Store embeddings as half precision (pgvector >= 0.7) to halve row and index size.
+DROP INDEX IF EXISTS issue_vectors_embedding_hnsw;
+DROP INDEX IF EXISTS issue_vectors_embedding_ivfflat;
+ALTER TABLE issue_vectors
+    ALTER COLUMN embedding TYPE HALFVEC(384) USING embedding::halfvec(384);
+CREATE INDEX IF NOT EXISTS issue_vectors_embedding_hnsw ON issue_vectors
+USING hnsw (embedding halfvec_l2_ops)
+WITH (m = 16, ef_construction = 200);
+CREATE INDEX IF NOT EXISTS issue_vectors_embedding_ivfflat ON issue_vectors
+USING ivfflat (embedding halfvec_l2_ops)
+WITH (lists = 100);
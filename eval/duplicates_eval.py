@@ -21,7 +21,8 @@ def parse_args() -> argparse.Namespace:
 
 def compute_embeddings(df: pd.DataFrame) -> np.ndarray:
     texts = [f"{row.title}\n\n{row.body}" for row in df.itertuples(index=False)]
-    return embeddings.encode_texts(texts)
+    # float16 is only the storage dtype; NumPy's float16 matmul bypasses BLAS.
+    return embeddings.encode_texts(texts, dtype=np.float32)
 
 def evaluate(df: pd.DataFrame, matrix: np.ndarray, k: int) -> dict[str, float]:
     similarities = matrix @ matrix.T
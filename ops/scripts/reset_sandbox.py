@@ -14,8 +14,6 @@ import sys
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Set
 
-from mpmath.calculus.calculus import defun
-
 SERVICE_CHOICES = [
     "postgres",
     "redis",
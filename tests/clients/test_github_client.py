@@ -5,8 +5,10 @@ import pytest
 from api.clients import github
 
 class DummyResponse:
-    def __init__(self, payload):
+    def __init__(self, payload, status_code=200, headers=None):
         self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
         self.called = False
 
     def json(self):
@@ -111,6 +113,107 @@ async def test_create_comment_posts_body(monkeypatch):
     assert captured["json"] == {"body": "body"}
     assert captured["response"].called
 
+@pytest.mark.asyncio
+async def test_request_retries_after_rate_limit(monkeypatch):
+    responses = [
+        DummyResponse(None, status_code=403, headers={"Retry-After": "2"}),
+        DummyResponse({"id": 6}),
+    ]
+    sleeps = []
+
+    async def fake_get(url):    # noqa: ANN001
+        return responses.pop(0)
+
+    async def fake_sleep(delay):    # noqa: ANN001
+        sleeps.append(delay)
+
+    async def fake_close():
+        pass
+
+    fake_client = SimpleNamespace(get=fake_get, post=None, aclose=fake_close)
+    monkeypatch.setattr(github.httpx, "AsyncClient", lambda **kwargs: fake_client)
+    monkeypatch.setattr(github.asyncio, "sleep", fake_sleep)
+
+    client = github.GitHubClient(token="token")
+    result = await client.fetch_issue("org/repo", 6)
+    await client.close()
+
+    assert result == {"id": 6}
+    assert sleeps == [2.0]
+    assert not responses
+
+def test_retry_delay_accepts_http_date(monkeypatch):
+    monkeypatch.setattr(github.time, "time", lambda: 1445412480.0)
+
+    delay = github._retry_delay(403, {"Retry-After": "Wed, 21 Oct 2015 07:28:30 GMT"})
+
+    assert delay == 30.0
+
+def test_retry_delay_falls_back_to_ratelimit_reset(monkeypatch):
+    monkeypatch.setattr(github.time, "time", lambda: 1000.0)
+
+    exhausted = {"Retry-After": "soon", "x-ratelimit-remaining": "0", "x-ratelimit-reset": "1005"}
+
+    assert github._retry_delay(403, exhausted) == 5.0
+    assert github._retry_delay(429, {"x-ratelimit-reset": "1005"}) == 5.0
+    assert github._retry_delay(403, {"Retry-After": "soon"}) is None
+
+@pytest.mark.asyncio
+async def test_request_returns_rate_limit_without_usable_delay(monkeypatch):
+    limited = DummyResponse(None, status_code=429, headers={"Retry-After": "later"})
+    calls = []
+
+    async def fake_get(url):    # noqa: ANN001
+        calls.append(url)
+        return limited
+
+    async def fake_sleep(delay):    # noqa: ANN001
+        raise AssertionError("should not sleep without a parseable delay")
+
+    async def fake_close():
+        pass
+
+    fake_client = SimpleNamespace(get=fake_get, post=None, aclose=fake_close)
+    monkeypatch.setattr(github.httpx, "AsyncClient", lambda **kwargs: fake_client)
+    monkeypatch.setattr(github.asyncio, "sleep", fake_sleep)
+
+    client = github.GitHubClient(token="token")
+    resp = await client._request("get", "/repos/org/repo/issues/7")
+    await client.close()
+
+    assert resp is limited
+    assert calls == ["/repos/org/repo/issues/7"]
+
+@pytest.mark.asyncio
+async def test_request_returns_permission_403_without_retry(monkeypatch):
+    forbidden = DummyResponse(
+        None,
+        status_code=403,
+        headers={"x-ratelimit-remaining": "4999", "x-ratelimit-reset": str(2**31)},
+    )
+    calls = []
+
+    async def fake_get(url):    # noqa: ANN001
+        calls.append(url)
+        return forbidden
+
+    async def fake_sleep(delay):    # noqa: ANN001
+        raise AssertionError("permission errors must not wait for the rate-limit reset")
+
+    async def fake_close():
+        pass
+
+    fake_client = SimpleNamespace(get=fake_get, post=None, aclose=fake_close)
+    monkeypatch.setattr(github.httpx, "AsyncClient", lambda **kwargs: fake_client)
+    monkeypatch.setattr(github.asyncio, "sleep", fake_sleep)
+
+    client = github.GitHubClient(token="token")
+    resp = await client._request("get", "/repos/org/repo/issues/8")
+    await client.close()
+
+    assert resp is forbidden
+    assert calls == ["/repos/org/repo/issues/8"]
+
 @pytest.mark.asyncio
 async def test_with_client_yields_and_closes(monkeypatch):
     closed = False
@@ -122,9 +225,21 @@ async def test_with_client_yields_and_closes(monkeypatch):
 
     monkeypatch.setattr(github, "GitHubClient", FakeClient)
 
-    context = github.with_client("token")
-    client = await context.__anext__()
-    assert isinstance(client, FakeClient)
-    with pytest.raises(StopAsyncIteration):
-        await context.__anext__()
+    async with github.with_client("token") as client:
+        assert isinstance(client, FakeClient)
+        assert not closed
     assert closed
+
+
+@pytest.mark.asyncio
+async def test_with_client_reuses_existing_without_closing():
+    class ExistingClient:
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    existing = ExistingClient()
+    async with github.with_client("token", existing=existing) as client:
+        assert client is existing
+    assert not existing.closed
@@ -1,4 +1,3 @@
-from http.client import responses
 from types import SimpleNamespace
 
 import pytest
@@ -123,9 +122,23 @@ async def test_with_client_yields_and_closes(monkeypatch):
 
     monkeypatch.setattr(jira, "JiraClient", FakeClient)
 
-    context = jira.with_client("https://yieldCloseTest", email="an@email.com", api_token="an_api_token")
-    client = await context.__anext__()
-    assert isinstance(client, FakeClient)
-    with pytest.raises(StopAsyncIteration):
-        await context.__anext__()
-    assert closed
\ No newline at end of file
+    async with jira.with_client("https://yieldCloseTest", email="an@email.com", api_token="an_api_token") as client:
+        assert isinstance(client, FakeClient)
+        assert not closed
+    assert closed
+
+
+@pytest.mark.asyncio
+async def test_with_client_reuses_existing_without_closing():
+    class ExistingClient:
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    existing = ExistingClient()
+    async with jira.with_client(
+        "https://reuseTest", email="an@email.com", api_token="an_api_token", existing=existing,
+    ) as client:
+        assert client is existing
+    assert not existing.closed
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from api import main
+from api.schemas import RetrievalResult, SearchResponse
+
+
+class DownRedis:
+    async def get(self, key: str):  # noqa: ANN201
+        raise RedisConnectionError("redis is down")
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        raise RedisConnectionError("redis is down")
+
+
+@pytest.mark.asyncio
+async def test_search_falls_back_when_redis_is_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_embed_query(app, text):  # noqa: ANN001
+        return np.zeros(3, dtype=np.float16)
+
+    async def fake_vector_search(pool, embedding, limit=10):  # noqa: ANN001
+        return [RetrievalResult(issue_id=1, title="Login fails", score=0.9)]
+
+    monkeypatch.setattr(main, "_embed_query", fake_embed_query)
+    monkeypatch.setattr(main.retrieve, "vector_search", fake_vector_search)
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=DownRedis())))
+
+    response = await main.search(request, q="login", k=5, hybrid_mode=False, alpha=0.5, pool=object())
+
+    assert response.status_code == 200
+    body = SearchResponse.model_validate_json(response.body)
+    assert [result.issue_id for result in body.results] == [1]
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get(self, key: str):  # noqa: ANN201
+        return self.store.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+
+@pytest.mark.asyncio
+async def test_search_serves_cached_body_verbatim(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    async def fake_embed_query(app, text):  # noqa: ANN001
+        calls.append(text)
+        return np.zeros(3, dtype=np.float16)
+
+    async def fake_vector_search(pool, embedding, limit=10):  # noqa: ANN001
+        return [RetrievalResult(issue_id=7, title="Export breaks", score=0.5)]
+
+    monkeypatch.setattr(main, "_embed_query", fake_embed_query)
+    monkeypatch.setattr(main.retrieve, "vector_search", fake_vector_search)
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=FakeRedis())))
+
+    first = await main.search(request, q="export", k=5, hybrid_mode=False, alpha=0.5, pool=object())
+    second = await main.search(request, q="export", k=5, hybrid_mode=False, alpha=0.5, pool=object())
+
+    assert calls == ["export"]
+    assert second.body == first.body
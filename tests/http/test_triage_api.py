@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from api import main
+from api.schemas import ProposalApproval
+
+
+class RecordingGitHubClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    async def add_labels(self, repo: str, number: int, labels: list[str]) -> None:
+        self.calls.append(("add_labels", repo, number, labels))
+
+    async def assign_issue(self, repo: str, number: int, assignees: list[str]) -> None:
+        self.calls.append(("assign_issue", repo, number, assignees))
+
+    async def create_comment(self, repo: str, number: int, body: str) -> None:
+        self.calls.append(("create_comment", repo, number, body))
+
+
+@pytest.mark.asyncio
+async def test_approve_adds_github_labels_and_assignees(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_fetchrow_prepared(pool, name, issue_id):  # noqa: ANN001
+        assert name == "issue_meta"
+        return {"source": "github", "repo": "org/repo", "raw_json": {"number": 3}}
+
+    monkeypatch.setattr(main, "_fetchrow_prepared", fake_fetchrow_prepared)
+    client = RecordingGitHubClient()
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(github_token="token", github_client=client)))
+    payload = ProposalApproval(issue_id=1, labels=["bug"], assignee="octocat", comment="Thanks!")
+
+    result = await main.approve_triage(payload, request, pool=object())
+
+    assert result == {"ok": True}
+    assert sorted(client.calls) == [
+        ("add_labels", "org/repo", 3, ["bug"]),
+        ("assign_issue", "org/repo", 3, ["octocat"]),
+        ("create_comment", "org/repo", 3, "Thanks!"),
+    ]
+
+
+class FreshConn:
+    """Connection to a database without pgvector or the triage schema yet."""
+
+    def __init__(self) -> None:
+        self.prepared_sql: list[str] = []
+
+    async def fetchval(self, query: str):  # noqa: ANN201
+        assert "to_regtype('halfvec')" in query
+        return None
+
+    async def prepare(self, sql: str):  # noqa: ANN201
+        self.prepared_sql.append(sql)
+        return SimpleNamespace(fetchrow=self._fetchrow)
+
+    async def _fetchrow(self, *args):  # noqa: ANN001, ANN202
+        return {"args": args}
+
+
+class FreshAcquire:
+    def __init__(self, conn: FreshConn) -> None:
+        self.conn = conn
+
+    async def __aenter__(self) -> FreshConn:
+        return self.conn
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        return None
+
+
+@pytest.mark.asyncio
+async def test_init_conn_defers_vector_codecs_and_statements(monkeypatch: pytest.MonkeyPatch) -> None:
+    registered: list[str] = []
+
+    async def fake_json_codecs(conn):  # noqa: ANN001
+        registered.append("json")
+
+    async def fake_vector_codecs(conn):  # noqa: ANN001
+        registered.append("vector")
+
+    monkeypatch.setattr(main, "register_json_codecs", fake_json_codecs)
+    monkeypatch.setattr(main, "register_vector_codecs", fake_vector_codecs)
+    conn = FreshConn()
+
+    await main._init_conn(conn)
+
+    assert registered == ["json"]
+    assert conn.prepared_sql == []
+
+    pool = SimpleNamespace(acquire=lambda: FreshAcquire(conn))
+    assert await main._fetchrow_prepared(pool, "issue_meta", 1) == {"args": (1,)}
+    assert await main._fetchrow_prepared(pool, "issue_meta", 2) == {"args": (2,)}
+    assert conn.prepared_sql == [main._PREPARED_SQL["issue_meta"]]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from api.http import viewer
 from api.services import retrieve
@@ -102,4 +103,81 @@ def test_search_endpoint_returns_items(test_app: FastAPI) -> None:
     response = client.get("/api/issues/search", params={"q": "auth"})
     assert response.status_code == 200
     payload = response.json()
-    assert payload["items"][0]["route"] == "/gh/foo/bar/issues/2"
\ No newline at end of file
+    assert payload["items"][0]["route"] == "/gh/foo/bar/issues/2"
+
+
+def test_search_endpoint_rejects_invalid_origin_url(test_app: FastAPI, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def bad_url_search(pool, *, filters, limit=50):  # noqa: ANN001
+        return [
+            {
+                "id": 3,
+                "source": "github",
+                "route": "/gh/foo/bar/issues/3",
+                "origin_url": "not a url",
+                "title": "Broken link",
+            }
+        ]
+
+    monkeypatch.setattr(retrieve, "search_viewer_issues", bad_url_search)
+    client = TestClient(test_app, raise_server_exceptions=False)
+    response = client.get("/api/issues/search", params={"q": "auth"})
+    assert response.status_code == 500
+
+
+def test_search_endpoint_reports_database_errors(test_app: FastAPI, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def failing_search(pool, *, filters, limit=50):  # noqa: ANN001
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(retrieve, "search_viewer_issues", failing_search)
+    client = TestClient(test_app, raise_server_exceptions=False)
+    response = client.get("/api/issues/search", params={"q": "auth"})
+    assert response.status_code == 500
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    async def get(self, key: str):  # noqa: ANN201
+        return self.store.get(key)
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.store[key] = value
+
+
+def test_routes_endpoint_serves_cached_payload(test_app: FastAPI, monkeypatch: pytest.MonkeyPatch) -> None:
+    test_app.state.redis = FakeRedis()
+    client = TestClient(test_app)
+
+    first = client.get("/api/routes")
+    assert first.status_code == 200
+    assert retrieve.ROUTES_CACHE_KEY in test_app.state.redis.store
+
+    async def fail_list_routes(pool):  # noqa: ANN001
+        raise AssertionError("routes should come from the cache")
+
+    monkeypatch.setattr(retrieve, "list_canonical_routes", fail_list_routes)
+    second = client.get("/api/routes")
+    assert second.status_code == 200
+    assert second.json() == first.json()
+
+
+class DownRedis:
+    async def get(self, key: str):  # noqa: ANN201
+        raise RedisConnectionError("redis is down")
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        raise RedisConnectionError("redis is down")
+
+
+def test_routes_endpoint_falls_back_when_redis_is_unavailable(test_app: FastAPI) -> None:
+    test_app.state.redis = DownRedis()
+    client = TestClient(test_app)
+
+    response = client.get("/api/routes")
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"route": "/gh/foo/bar/issues/1"},
+        {"route": "/jira/site/ABC/ABC-1"},
+    ]
@@ -8,7 +8,7 @@ class DummyModel:
         self.name = name
         self.calls: list[list[str]] = []
 
-    def encode(self, texts, convert_to_numpy, show_progress_bar, normalize_embeddings):
+    def encode(self, texts, convert_to_numpy, show_progress_bar, normalize_embeddings, batch_size=32):
         self.calls.append(list(texts))
         base = np.arange(len(texts) * 3, dtype=np.float32).reshape(len(texts), 3)
         return base
@@ -16,8 +16,12 @@ class DummyModel:
 @pytest.fixture(autouse=True)
 def clear_model_cache():
     embeddings.get_model.cache_clear()
+    embeddings.clear_query_cache()
+    embeddings.clear_issue_cache()
     yield
     embeddings.get_model.cache_clear()
+    embeddings.clear_query_cache()
+    embeddings.clear_issue_cache()
 
 def test_get_model_uses_lru_cache(monkeypatch):
     created_models: list[str] = []
@@ -34,16 +38,39 @@ def test_get_model_uses_lru_cache(monkeypatch):
     assert model1 is model2
     assert created_models == ["testModel-a"]
 
-def test_encode_texts_returns_float32(monkeypatch):
+def test_encode_texts_returns_float16_by_default(monkeypatch):
     dummy = DummyModel("model")
     monkeypatch.setattr(embeddings, "SentenceTransformer", lambda name: dummy)
 
     vectors = embeddings.encode_texts(["Unit test 2", "function 2"], model_name="model")
 
     assert vectors.shape == (2, 3)
-    assert vectors.dtype == np.float32
+    assert vectors.dtype == np.float16
     assert dummy.calls == [["Unit test 2", "function 2"]]
 
+def test_encode_texts_can_return_float32(monkeypatch):
+    dummy = DummyModel("model")
+    monkeypatch.setattr(embeddings, "SentenceTransformer", lambda name: dummy)
+
+    vectors = embeddings.encode_texts(["Unit test 2"], model_name="model", dtype=np.float32)
+
+    assert vectors.dtype == np.float32
+
+def test_encode_texts_sorts_batches_by_length_and_restores_order(monkeypatch):
+    class LengthModel(DummyModel):
+        def encode(self, texts, convert_to_numpy, show_progress_bar, normalize_embeddings, batch_size=32):
+            self.calls.append(list(texts))
+            return np.array([[len(text)] * 3 for text in texts], dtype=np.float32)
+
+    dummy = LengthModel("model")
+    monkeypatch.setattr(embeddings, "SentenceTransformer", lambda name: dummy)
+
+    texts = ["aa", "aaaa", "a", "aaa"]
+    vectors = embeddings.encode_texts(texts, model_name="model", batch_size=2)
+
+    assert dummy.calls == [["aaaa", "aaa"], ["aa", "a"]]
+    np.testing.assert_array_equal(vectors[:, 0], [2, 4, 1, 3])
+
 def test_embedding_for_issue_concatenates_title_and_body(monkeypatch):
     captured = {}
 
@@ -56,4 +83,87 @@ def test_embedding_for_issue_concatenates_title_and_body(monkeypatch):
     vector = embeddings.embedding_for_issue("Title", "Body", model_name="model")
 
     assert vector.shape == (3,)
-    assert captured["texts"] == ["Title\n\nBody"]
\ No newline at end of file
+    assert captured["texts"] == ["Title\n\nBody"]
+
+def test_embedding_for_issue_reuses_cached_vectors(monkeypatch):
+    dummy = DummyModel("model")
+    monkeypatch.setattr(embeddings, "SentenceTransformer", lambda name: dummy)
+
+    first = embeddings.embedding_for_issue("Title", "Body", model_name="model")
+    second = embeddings.embedding_for_issue("Title", "Body", model_name="model")
+    embeddings.embedding_for_issue("Title", "Edited body", model_name="model")
+
+    assert dummy.calls == [["Title\n\nBody"], ["Title\n\nEdited body"]]
+    np.testing.assert_array_equal(first, second)
+    assert not second.flags.writeable
+
+def test_encode_queries_reuses_cached_vectors(monkeypatch):
+    dummy = DummyModel("model")
+    monkeypatch.setattr(embeddings, "SentenceTransformer", lambda name: dummy)
+
+    first = embeddings.encode_queries(["alpha", "beta"], model_name="model")
+    second = embeddings.encode_queries(["beta", "gamma", "beta"], model_name="model")
+
+    assert dummy.calls == [["alpha", "beta"], ["gamma"]]
+    assert second.shape == (3, 3)
+    np.testing.assert_array_equal(second[0], first[1])
+    np.testing.assert_array_equal(second[2], first[1])
+
+def test_embeddings_for_issues_encodes_pairs_in_one_call(monkeypatch):
+    dummy = DummyModel("model")
+    monkeypatch.setattr(embeddings, "SentenceTransformer", lambda name: dummy)
+
+    vectors = embeddings.embeddings_for_issues([("Title", "Body"), ("Only title", "")], model_name="model")
+
+    assert vectors.shape == (2, 3)
+    assert vectors.dtype == np.float16
+    assert len(dummy.calls) == 1
+    assert sorted(dummy.calls[0]) == ["Only title", "Title\n\nBody"]
+
+def test_get_model_passes_onnx_backend(monkeypatch):
+    captured = {}
+
+    def factory(name, **kwargs):   # noqa: ANN001, ANN003
+        captured["args"] = (name, kwargs)
+        return DummyModel(name)
+
+    monkeypatch.setattr(embeddings, "SentenceTransformer", factory)
+    monkeypatch.setattr(embeddings, "EMBED_BACKEND", "onnx")
+    monkeypatch.setattr(embeddings, "EMBED_MODEL_FILE", "onnx/model_O3.onnx")
+
+    embeddings.get_model("testModel-onnx")
+
+    assert captured["args"] == (
+        "testModel-onnx",
+        {
+            "backend": "onnx",
+            "model_kwargs": {"provider": "CPUExecutionProvider", "file_name": "onnx/model_O3.onnx"},
+        },
+    )
+
+def test_get_model_selects_int8_export_when_vnni_available(monkeypatch):
+    captured = {}
+
+    def factory(name, **kwargs):   # noqa: ANN001, ANN003
+        captured["kwargs"] = kwargs
+        return DummyModel(name)
+
+    monkeypatch.setattr(embeddings, "SentenceTransformer", factory)
+    monkeypatch.setattr(embeddings, "EMBED_BACKEND", "onnx")
+    monkeypatch.setattr(embeddings, "EMBED_MODEL_FILE", "")
+    monkeypatch.setattr(embeddings, "EMBED_QUANT", "int8")
+    monkeypatch.setattr(embeddings, "_cpu_supports_vnni", lambda: True)
+
+    embeddings.get_model("testModel-int8")
+
+    assert captured["kwargs"]["model_kwargs"]["file_name"] == embeddings.INT8_ONNX_FILE
+
+def test_get_model_warns_when_quant_needs_onnx(monkeypatch, caplog):
+    monkeypatch.setattr(embeddings, "SentenceTransformer", lambda name: DummyModel(name))
+    monkeypatch.setattr(embeddings, "EMBED_BACKEND", "torch")
+    monkeypatch.setattr(embeddings, "EMBED_QUANT", "int8")
+
+    with caplog.at_level("WARNING", logger="api.services.embeddings"):
+        embeddings.get_model("testModel-torch")
+
+    assert "EMBED_QUANT only applies to EMBED_BACKEND=onnx" in caplog.text
@@ -5,7 +5,6 @@ from dataclasses import dataclass
 from typing import Any, Dict, List
 
 import pytest
-from numpy.f2py.auxfuncs import isintent_in
 
 from api.services.paraphrase_engine import (
     HFApiParaphraser,
@@ -51,6 +50,16 @@ def _mask_and_paraphrase(
     return result, restored, client
 
 
+def test_locked_entity_guard_prefers_earlier_patterns() -> None:
+    """Overlapping matches resolve by pattern priority, not by position."""
+
+    guard = LockedEntityGuard()
+    masked, spans = guard.mask("see feature/oauth-flow and src/app/main.py")
+
+    assert [value for _, value in spans] == ["/oauth-flow", "/app/main.py"]
+    assert masked == f"see feature{spans[0][0]} and src{spans[1][0]}"
+
+
 def test_hf_api_paraphraser_preserves_locked_entities() -> None:
     """The Hugging Face API paraphraser must keep locked entities verbatim."""
 
@@ -74,6 +83,30 @@ def test_hf_api_paraphraser_respects_budget() -> None:
     assert result.edited_tokens == 0
 
 
+def test_hf_api_paraphrase_batch_keeps_order_and_skips_blank() -> None:
+    """Batched paraphrasing returns one result per input in input order."""
+
+    class EchoClient:
+        def __init__(self) -> None:
+            self.prompts: List[str] = []
+
+        def text_generation(self, prompt: str, **options: Any) -> str:
+            self.prompts.append(prompt)
+            return prompt.removeprefix("paraphrase: ").replace("fails", "breaks")
+
+    client = EchoClient()
+    provider = HFApiParaphraser(paraphrase_budget=5, client=client)
+    texts = ["Login fails on retry", "   ", "Export fails for large files"]
+    results = provider.paraphrase_batch(texts, seed="demo-seed")
+    assert [result.text for result in results] == [
+        "Login breaks on retry",
+        "   ",
+        "Export breaks for large files",
+    ]
+    assert [result.edited_tokens for result in results] == [1, 0, 1]
+    assert len(client.prompts) == 2
+
+
 def test_provider_registry_supports_hf_api() -> None:
     """Registry should build an HFApiParaphraser with injected client."""
 
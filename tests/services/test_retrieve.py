@@ -68,7 +68,7 @@ async def test_vector_search_returns_results_with_urls():
     query_text, params = pool.conn.fetch_calls[0]
     # The vector embedding is interpolated as a pgvector literal and no longer
     # passed as a positional parameter.
-    assert "::vector" in query_text
+    assert "::halfvec" in query_text
     assert params == ("model", 2)
     first = results[0]
     assert isinstance(first, RetrievalResult)
@@ -101,7 +101,7 @@ async def test_hybrid_search_combines_scores():
 
     assert len(results) == 1
     query_text, params = pool.conn.fetch_calls[0]
-    assert "::vector" in query_text
+    assert "::halfvec" in query_text
     assert params == (1, "bug", 0.75, "sentence-transformers/all-MiniLM-L6-v2")
     result = results[0]
     assert result.route == "/gh/org/repo/issues/10"
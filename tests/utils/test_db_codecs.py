@@ -0,0 +1,41 @@
+import struct
+
+import numpy as np
+
+from api.utils import db_codecs
+
+
+def test_halfvec_round_trip_preserves_values():
+    vector = np.array([0.5, -1.25, 3.0], dtype=np.float32)
+
+    encoded = db_codecs.encode_halfvec(vector)
+    decoded = db_codecs.decode_halfvec(encoded)
+
+    assert struct.unpack_from(">HH", encoded) == (3, 0)
+    assert len(encoded) == 4 + 3 * 2
+    assert decoded.dtype == np.float16
+    np.testing.assert_array_equal(decoded, vector.astype(np.float16))
+
+
+def test_encode_halfvec_accepts_text_literal():
+    assert db_codecs.encode_halfvec("[1,2]") == db_codecs.encode_halfvec([1.0, 2.0])
+
+
+def test_vector_round_trip_is_float32():
+    vector = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+
+    decoded = db_codecs.decode_vector(db_codecs.encode_vector(vector))
+
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, vector)
+
+
+def test_json_codec_round_trip_and_passthrough():
+    payload = {"issue": {"number": 7, "labels": ["bug"]}}
+
+    encoded = db_codecs.encode_jsonb(payload)
+
+    assert encoded[:1] == b"\x01"
+    assert db_codecs.decode_jsonb(encoded) == payload
+    assert db_codecs.decode_json(db_codecs.encode_json(payload)) == payload
+    assert db_codecs.encode_json('{"already": "serialized"}') == b'{"already": "serialized"}'
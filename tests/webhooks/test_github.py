@@ -33,9 +33,13 @@ def test_github_webhook_processes_issue(monkeypatch):
     async def fake_enqueue(redis, issue_id, force=False):   # noqa: ANN001
         called.setdefault("enqueue", []).append((redis, issue_id, force))
 
+    async def fake_invalidate(redis):   # noqa: ANN001
+        called["invalidate"] = redis
+
     monkeypatch.setattr(github.ingest, "normalize_github_issue", lambda payload: payload)
     monkeypatch.setattr(github.ingest, "store_issue", fake_store)
     monkeypatch.setattr(github.ingest, "enqueue_embedding_job", fake_enqueue)
+    monkeypatch.setattr(github.ingest, "invalidate_routes_cache", fake_invalidate)
 
     client = TestClient(app)
     response = client.post(
@@ -50,6 +54,7 @@ def test_github_webhook_processes_issue(monkeypatch):
     assert response.status_code == 200
     assert called["store"][0] is app.state.db_pool
     assert called["enqueue"][0][0] is app.state.redis
+    assert called["invalidate"] is app.state.redis
     assert called["enqueue"][0][1] == 42
 
 def test_github_webhook_rejects_bad_signature():
@@ -27,8 +27,12 @@ def test_jira_webhook_accepts_valid_identifier(monkeypatch):
     async def fake_enqueue(redis, issue_id, force=False):   # noqa: ANN001
         called.setdefault("enqueue", []).append((redis, issue_id, force))
 
+    async def fake_invalidate(redis):   # noqa: ANN001
+        called["invalidate"] = redis
+
     monkeypatch.setattr(jira.ingest, "store_issue", fake_store)
     monkeypatch.setattr(jira.ingest, "enqueue_embedding_job", fake_enqueue)
+    monkeypatch.setattr(jira.ingest, "invalidate_routes_cache", fake_invalidate)
 
     client = TestClient(app)
     response = client.post(
@@ -40,6 +44,7 @@ def test_jira_webhook_accepts_valid_identifier(monkeypatch):
     assert response.status_code == 200
     assert called["store"][0] is app.state.db_pool
     assert called["enqueue"][0][0] is app.state.redis
+    assert called["invalidate"] is app.state.redis
 
 def test_jira_webhook_rejects_invalid_identifier():
     app = make_app("secret")
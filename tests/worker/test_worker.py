@@ -1,3 +1,6 @@
+import re
+from pathlib import Path
+
 import numpy as np
 import pytest
 
@@ -54,6 +57,27 @@ async def test_process_job_inserts_embeddings(monkeypatch):
     assert any("INSERT INTO issue_vectors" in call[0] for call in conn.execute_calls)
     assert any("INSERT INTO similar_issues" in call[0] for call in conn.execute_calls)
 
+@pytest.mark.asyncio
+async def test_process_job_vector_insert_matches_schema(monkeypatch):
+    conn = FakeConn(issue_exists=True, vector_exists=False)
+    pool = FakePool(conn)
+
+    monkeypatch.setattr(
+        worker_module.embeddings,
+        "embedding_for_issue",
+        lambda title, body: np.array([0.1, 0.2], dtype=np.float32),
+    )
+
+    await worker_module.process_job(pool, {"issue_id": 5, "force": False})
+
+    schema = (Path(__file__).resolve().parents[2] / "db" / "init.sql").read_text()
+    table = re.search(r"CREATE TABLE IF NOT EXISTS issue_vectors \((.*?)\n\);", schema, re.S).group(1)
+    schema_columns = {line.split()[0] for line in table.strip().splitlines()}
+    insert = next(query for query, _ in conn.execute_calls if "INSERT INTO issue_vectors" in query)
+    columns = re.search(r"INSERT INTO issue_vectors \(([^)]*)\)", insert).group(1)
+
+    assert {column.strip() for column in columns.split(",")} <= schema_columns
+
 @pytest.mark.asyncio
 async def test_process_job_skips_when_issue_missing(monkeypatch):
     conn = FakeConn(issue_exists=False)
@@ -6,10 +6,10 @@ import json
 import os
 
 import asyncpg
-import numpy as np
 from redis import asyncio as aioredis
 
 from api.services import embeddings
+from api.utils.db_codecs import register_vector_codecs
 from api.utils.logging_utils import bind_context, clear_context, get_logger, logging_context, setup_logging
 
 setup_logging()
@@ -35,10 +35,9 @@ async def process_job(pool: asyncpg.Pool, job: dict[str, object]) -> None:
                     return
             logger.info("Computing embedding")
             vector = embeddings.embedding_for_issue(record["title"], record["body"])
-            vector_list = np.asarray(vector, dtype=np.float32, copy=False).tolist()
             await conn.execute(
                 """
-                INSERT INTO issue_vectors (issue_id, embedding, model, updpated_at)
+                INSERT INTO issue_vectors (issue_id, embedding, model, updated_at)
                 VALUES ($1, $2, $3, NOW())
                 ON CONFLICT (issue_id) DO UPDATE SET
                     embedding = EXCLUDED.embedding,
@@ -46,7 +45,7 @@ async def process_job(pool: asyncpg.Pool, job: dict[str, object]) -> None:
                     updated_at = NOW()
                 """,
                 issue_id,
-                vector_list,
+                vector,
                 embeddings.DEFAULT_MODEL,
             )
             await conn.execute(
@@ -64,7 +63,7 @@ async def process_job(pool: asyncpg.Pool, job: dict[str, object]) -> None:
                 ON CONFLICT DO NOTHING
                 """,
                 issue_id,
-                vector_list,
+                vector,
                 embeddings.DEFAULT_MODEL,
             )
             logger.info("Updated embedding")
@@ -76,7 +75,7 @@ async def worker() -> None:
     redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
     if not database_url:
         raise RuntimeError("DATABASE_URL is required")
-    pool = await asyncpg.create_pool(dsn=database_url)
+    pool = await asyncpg.create_pool(dsn=database_url, init=register_vector_codecs)
     redis = aioredis.from_url(redis_url, encoding="utf-8", decode_responses=True)
     try:
         while True: